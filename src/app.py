@@ -1,6 +1,7 @@
 """Property Investment Insights: Interactive Streamlit Dashboard."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pydeck as pdk
 import streamlit as st
@@ -48,69 +49,101 @@ files = DataFiles(
 result = execute_pipeline(files)
 merged = result["data"]
 
-# Build interactive sidebar filters for what-if analysis
+# Build interactive sidebar filters for what-if analysis; option lists and
+# slider bounds come precomputed (and cached) from the pipeline
+options = result["options"]
 st.sidebar.header("Filters")
-zip_options = sorted(merged["zip_code"].dropna().unique().tolist())
 
 # ZIP code filter (multi-select)
-selected_zips = st.sidebar.multiselect("ZIP Codes", options=zip_options, default=zip_options)
+selected_zips = st.sidebar.multiselect(
+    "ZIP Codes", options=options["zips"], default=options["zips"]
+)
 
 # Price range filter (slider)
-price_min, price_max = merged["listing_price"].min(), merged["listing_price"].max()
+price_min, price_max = options["price"]
 price_range = st.sidebar.slider(
     "Listing Price Range",
-    float(price_min),
-    float(price_max),
-    (float(price_min), float(price_max)),
+    price_min,
+    price_max,
+    (price_min, price_max),
 )
 
 # Minimum median income filter (threshold slider)
-income_min, income_max = merged["median_income"].min(), merged["median_income"].max()
+income_min, income_max = options["income"]
 income_threshold = st.sidebar.slider(
     "Minimum Median Income",
-    float(income_min),
-    float(income_max),
-    float(income_min),
+    income_min,
+    income_max,
+    income_min,
 )
 
 # School rating range filter (slider)
-school_min, school_max = merged["school_rating"].min(), merged["school_rating"].max()
+school_min, school_max = options["school"]
 school_range = st.sidebar.slider(
     "School Rating Range",
-    float(school_min),
-    float(school_max),
-    (float(school_min), float(school_max)),
+    school_min,
+    school_max,
+    (school_min, school_max),
 )
 
 # Crime index filter (multi-select categorical)
-crime_options = sorted(merged["crime_index"].dropna().unique().tolist())
-selected_crime = st.sidebar.multiselect("Crime Index", options=crime_options, default=crime_options)
+selected_crime = st.sidebar.multiselect(
+    "Crime Index", options=options["crime"], default=options["crime"]
+)
 
 # Bedrooms filter (multi-select)
-bedroom_options = sorted(merged["bedrooms"].dropna().unique().tolist())
 selected_bedrooms = st.sidebar.multiselect(
-    "Bedrooms", options=bedroom_options, default=bedroom_options
+    "Bedrooms", options=options["bedrooms"], default=options["bedrooms"]
 )
 
-# Apply all filters to create subset of data for analysis
-filtered = merged[
-    (merged["zip_code"].isin(selected_zips))
-    & (merged["listing_price"].between(price_range[0], price_range[1]))
-    & (merged["median_income"] >= income_threshold)
-    & (merged["school_rating"].between(school_range[0], school_range[1]))
-    & (merged["crime_index"].isin(selected_crime))
-    & (merged["bedrooms"].isin(selected_bedrooms))
-].copy()
+# Apply all filters to create subset of data for analysis; masks are plain
+# numpy arrays combined in one reduce pass to avoid Series temporaries.
+# A DataFrame.query(engine="numexpr") variant was benchmarked but loses
+# here: numexpr cannot evaluate Arrow-backed/categorical columns and falls
+# back to the python engine, which is slower at both 200 and 100k rows.
+mask = np.logical_and.reduce(
+    [
+        # na_value=False makes Arrow-backed comparisons on null cells
+        # behave like the numpy masks did (missing never matches)
+        merged["zip_code"].isin(selected_zips).to_numpy(dtype=bool, na_value=False),
+        merged["listing_price"]
+        .between(price_range[0], price_range[1])
+        .to_numpy(dtype=bool, na_value=False),
+        (merged["median_income"] >= income_threshold).to_numpy(
+            dtype=bool, na_value=False
+        ),
+        merged["school_rating"]
+        .between(school_range[0], school_range[1])
+        .to_numpy(dtype=bool, na_value=False),
+        merged["crime_index"].isin(selected_crime).to_numpy(dtype=bool, na_value=False),
+        merged["bedrooms"].isin(selected_bedrooms).to_numpy(dtype=bool, na_value=False),
+    ]
+)
+filtered = merged.iloc[np.flatnonzero(mask)]
+
+# Cheap cache key for the figure builders: identical filters mean
+# identical figures, regardless of how expensive the frame is to hash
+filter_fingerprint = (
+    tuple(selected_zips),
+    price_range,
+    income_threshold,
+    school_range,
+    tuple(selected_crime),
+    tuple(selected_bedrooms),
+)
 
 # Display key performance indicators
 st.subheader("Key Performance Indicators")
 col1, col2, col3, col4 = st.columns(4)
 
-# Calculate KPIs from filtered data
-avg_price_per_sqft = filtered["price_per_sqft"].mean()
-median_price = filtered["listing_price"].median()
-avg_school = filtered["school_rating"].mean()
-avg_income = filtered["median_income"].mean()
+# Calculate KPIs from filtered data in one aggregation pass
+kpis = filtered[
+    ["price_per_sqft", "listing_price", "school_rating", "median_income"]
+].agg(["mean", "median"])
+avg_price_per_sqft = kpis.at["mean", "price_per_sqft"]
+median_price = kpis.at["median", "listing_price"]
+avg_school = kpis.at["mean", "school_rating"]
+avg_income = kpis.at["mean", "median_income"]
 
 # Display KPI metrics with formatted values
 col1.metric("Avg Price / SqFt", f"${avg_price_per_sqft:,.0f}" if pd.notna(avg_price_per_sqft) else "N/A")
@@ -120,17 +153,22 @@ col4.metric("Avg Median Income", f"${avg_income:,.0f}" if pd.notna(avg_income) e
 
 # Display geospatial visualizations
 st.subheader("Geospatial Insights")
-map_data = filtered.dropna(subset=["lat", "lon"])
+# Only the columns the deck actually renders get serialized to the browser
+map_data = filtered.dropna(subset=["lat", "lon"])[
+    ["lon", "lat", "listing_price", "raw_address"]
+]
 if not map_data.empty:
     # Create map with scatter and heatmap layers
-    view = map_view(map_data)
-    layers = map_layers(map_data)
+    view = map_view(map_data, filter_fingerprint)
+    layers = map_layers(map_data, filter_fingerprint)
     deck = pdk.Deck(
         layers=layers,
         initial_view_state=view,
         tooltip={"text": "{raw_address}\n${listing_price}"},
     )
-    st.pydeck_chart(deck, use_container_width=True)
+    # Fixed key lets deck.gl diff updates into the existing canvas instead
+    # of tearing it down on every rerun
+    st.pydeck_chart(deck, use_container_width=True, key="main-deck")
 else:
     st.info("No geo data available for selected filters.")
 
@@ -140,19 +178,22 @@ chart_col1, chart_col2 = st.columns(2)
 
 # Scatter plot: School rating vs listing price (colored by crime, sized by sqft)
 with chart_col1:
-    st.plotly_chart(price_vs_school_chart(filtered), use_container_width=True)
+    st.plotly_chart(price_vs_school_chart(filtered, filter_fingerprint), use_container_width=True)
 
 # Histogram: Distribution of listing prices by crime index
 with chart_col2:
-    st.plotly_chart(price_distribution_chart(filtered), use_container_width=True)
+    st.plotly_chart(
+        price_distribution_chart(filtered, filter_fingerprint), use_container_width=True
+    )
 
 # Bar chart: Average price per sqft by ZIP code (sorted descending)
-st.plotly_chart(price_per_sqft_by_zip(filtered), use_container_width=True)
+st.plotly_chart(price_per_sqft_by_zip(filtered, filter_fingerprint), use_container_width=True)
 
-# Display detailed merged data table sorted by price (highest first)
+# Display detailed merged data table sorted by price (highest first);
+# nlargest is a partial sort and caps the payload sent to the front-end
 st.subheader("Merged Data")
 st.dataframe(
-    filtered.sort_values("listing_price", ascending=False),
+    filtered.nlargest(500, "listing_price"),
     use_container_width=True,
     height=420,
 )
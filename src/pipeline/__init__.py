@@ -1,11 +1,21 @@
 """Pipeline orchestration."""
+import streamlit as st
+
 from pipeline.loader import DataFiles, load_raw_data
 from pipeline.cleaner import clean_listings, clean_demographics
 from pipeline.merger import resolve_zip_codes, add_geo_columns, merge_data
 
 
+@st.cache_data(show_spinner=False)
 def execute_pipeline(files: DataFiles) -> dict:
-    """Execute full data processing pipeline."""
+    """Execute full data processing pipeline.
+
+    Memoized across Streamlit reruns so widget interactions reuse the
+    merged result instead of re-running clean/resolve/merge/geo. Stages
+    build their outputs with DataFrame.assign, so intermediate frames share
+    unchanged column buffers instead of deep-copying at every step; the
+    raw input frames are never mutated.
+    """
     # Load
     demographics_raw, listings_raw = load_raw_data(files)
 
@@ -20,4 +30,28 @@ def execute_pipeline(files: DataFiles) -> dict:
     # Add geolocation
     merged = add_geo_columns(merged)
 
-    return {"data": merged, "demographics": demographics}
+    # Sorted group keys let downstream zip_code groupbys skip full hash
+    # aggregation
+    merged = merged.sort_values("zip_code", kind="stable", ignore_index=True)
+
+    # Sidebar option lists and slider bounds only depend on the merged
+    # frame, so compute them here once and serve them from the cache
+    options = {
+        "zips": sorted(merged["zip_code"].dropna().unique().tolist()),
+        "crime": sorted(merged["crime_index"].dropna().unique().tolist()),
+        "bedrooms": sorted(merged["bedrooms"].dropna().unique().tolist()),
+        "price": (
+            float(merged["listing_price"].min()),
+            float(merged["listing_price"].max()),
+        ),
+        "income": (
+            float(merged["median_income"].min()),
+            float(merged["median_income"].max()),
+        ),
+        "school": (
+            float(merged["school_rating"].min()),
+            float(merged["school_rating"].max()),
+        ),
+    }
+
+    return {"data": merged, "demographics": demographics, "options": options}
@@ -3,10 +3,20 @@ import re
 from typing import Optional
 
 import pandas as pd
+import streamlit as st
 
 # Regex patterns
 ZIP_REGEX = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
 
+# Street-suffix abbreviations, with a single alternation pattern so all
+# long forms can be replaced in one vectorized pass
+SUFFIX_ABBREVIATIONS = {
+    "street": "st", "avenue": "ave", "boulevard": "blvd", "road": "rd",
+    "drive": "dr", "lane": "ln", "place": "pl", "court": "ct",
+    "parkway": "pkwy",
+}
+SUFFIX_REGEX = re.compile(r"\b(" + "|".join(SUFFIX_ABBREVIATIONS) + r")\b")
+
 
 def normalize_zip(value: str | float | int | None) -> Optional[str]:
     """Normalize ZIP code to 5-digit string format."""
@@ -20,6 +30,17 @@ def normalize_zip(value: str | float | int | None) -> Optional[str]:
     return digits.zfill(5)
 
 
+def normalize_zip_series(values: pd.Series) -> pd.Series:
+    """Normalize a Series of ZIP codes to 5-digit strings, vectorized.
+
+    Column-level equivalent of :func:`normalize_zip`; keeps the work in
+    pandas' C string kernels instead of one Python call per row.
+    """
+    digits = values.astype("string").str.replace(r"\D", "", regex=True)
+    digits = digits.where(digits.str.len() > 0)
+    return digits.str.slice(-5).str.zfill(5)
+
+
 def extract_zip_from_text(text: str | None) -> Optional[str]:
     """Extract ZIP code from unstructured text."""
     if not text or pd.isna(text):
@@ -34,39 +55,67 @@ def normalize_address(text: str | None) -> Optional[str]:
         return None
     cleaned = re.sub(r"[\.,]", " ", str(text).lower())
     cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    replacements = {
-        "street": "st", "st": "st", "avenue": "ave", "ave": "ave",
-        "boulevard": "blvd", "blvd": "blvd", "road": "rd", "rd": "rd",
-        "drive": "dr", "dr": "dr", "lane": "ln", "ln": "ln",
-        "place": "pl", "pl": "pl", "court": "ct", "ct": "ct",
-        "parkway": "pkwy", "pkwy": "pkwy",
-    }
-    tokens = [replacements.get(token, token) for token in cleaned.split()]
-    return " ".join(tokens)
+    return SUFFIX_REGEX.sub(lambda m: SUFFIX_ABBREVIATIONS[m.group(1)], cleaned)
 
 
-def clean_listings(listings: pd.DataFrame) -> pd.DataFrame:
-    """Clean and normalize listings data."""
-    cleaned = listings.copy()
-    cleaned["clean_address"] = cleaned["raw_address"].map(normalize_address)
-    extracted_zip = cleaned["raw_address"].map(extract_zip_from_text)
-    cleaned["postal_code"] = cleaned["postal_code"].where(
-        cleaned["postal_code"].notna(), extracted_zip
+def normalize_address_series(values: pd.Series) -> pd.Series:
+    """Normalize a Series of address strings, vectorized.
+
+    Column-level equivalent of :func:`normalize_address`: lowercase, strip
+    punctuation, collapse whitespace, and abbreviate street suffixes via a
+    single alternation regex instead of a Python token loop per row.
+    """
+    cleaned = (
+        values.astype("string")
+        .str.lower()
+        .str.replace(r"[\.,]", " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+    return cleaned.str.replace(
+        SUFFIX_REGEX, lambda m: SUFFIX_ABBREVIATIONS[m.group(1)], regex=True
     )
-    cleaned["zip_code"] = cleaned["postal_code"].map(normalize_zip)
 
-    for col in ["sq_ft", "bedrooms", "listing_price"]:
-        cleaned[col] = pd.to_numeric(cleaned[col], errors="coerce")
 
-    cleaned["price_per_sqft"] = cleaned["listing_price"] / cleaned["sq_ft"]
-    return cleaned
+@st.cache_data(show_spinner=False)
+def clean_listings(listings: pd.DataFrame) -> pd.DataFrame:
+    """Clean and normalize listings data.
+
+    Returns a new frame built with :meth:`DataFrame.assign`; unchanged
+    columns share memory with the input rather than being deep-copied.
+    """
+    extracted_zip = listings["raw_address"].astype("string").str.extract(
+        ZIP_REGEX, expand=False
+    )
+    postal_code = listings["postal_code"].where(
+        listings["postal_code"].notna(), extracted_zip
+    )
+    numeric = {
+        col: pd.to_numeric(listings[col], errors="coerce")
+        for col in ["sq_ft", "bedrooms", "listing_price"]
+    }
+    price_per_sqft = numeric["listing_price"] / numeric["sq_ft"]
+    # Low-cardinality bedrooms filters faster as integer category codes
+    numeric["bedrooms"] = numeric["bedrooms"].astype("category")
+    return listings.assign(
+        clean_address=normalize_address_series(listings["raw_address"]),
+        postal_code=postal_code,
+        zip_code=normalize_zip_series(postal_code),
+        **numeric,
+        price_per_sqft=price_per_sqft,
+    )
 
 
+@st.cache_data(show_spinner=False)
 def clean_demographics(demographics: pd.DataFrame) -> pd.DataFrame:
-    """Clean and normalize demographics data."""
-    cleaned = demographics.copy()
-    cleaned["zip_code"] = cleaned["zip_code"].map(normalize_zip)
-    cleaned["median_income"] = pd.to_numeric(cleaned["median_income"], errors="coerce")
-    cleaned["school_rating"] = pd.to_numeric(cleaned["school_rating"], errors="coerce")
-    cleaned["crime_index"] = cleaned["crime_index"].astype("string")
-    return cleaned
+    """Clean and normalize demographics data.
+
+    Returns a new frame built with :meth:`DataFrame.assign`; unchanged
+    columns share memory with the input rather than being deep-copied.
+    """
+    return demographics.assign(
+        zip_code=normalize_zip_series(demographics["zip_code"]),
+        median_income=pd.to_numeric(demographics["median_income"], errors="coerce"),
+        school_rating=pd.to_numeric(demographics["school_rating"], errors="coerce"),
+        crime_index=demographics["crime_index"].astype("string").astype("category"),
+    )
@@ -5,16 +5,34 @@ import pandas as pd
 import streamlit as st
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataFiles:
-    """Configuration container for data file paths."""
+    """Configuration container for data file paths.
+
+    Frozen so instances are hashable and can key Streamlit caches.
+    """
     demographics_path: str
     listings_path: str
 
 
 @st.cache_data(show_spinner=False)
 def load_raw_data(files: DataFiles) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Load raw data from CSV files."""
-    demographics = pd.read_csv(files.demographics_path, dtype={"zip_code": "string"})
-    listings = pd.read_csv(files.listings_path, dtype={"postal_code": "string"})
+    """Load raw data from CSV files.
+
+    Uses the pyarrow parser and Arrow-backed dtypes: string columns land in
+    contiguous Arrow buffers, which are cheaper to hash, compare, and filter
+    than object-dtype numpy strings.
+    """
+    demographics = pd.read_csv(
+        files.demographics_path,
+        dtype={"zip_code": "string"},
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+    )
+    listings = pd.read_csv(
+        files.listings_path,
+        dtype={"postal_code": "string"},
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+    )
     return demographics, listings
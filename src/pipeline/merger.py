@@ -1,10 +1,15 @@
 """ZIP code matching and data merging."""
+from pathlib import Path
 from typing import Iterable, Optional
 
 import numpy as np
 import pandas as pd
+import streamlit as st
 from rapidfuzz import fuzz, process
 
+# On-disk ZIP -> (lat, lon) lookup table, reused across cold starts
+GEO_CACHE_PATH = Path(".cache/geo.parquet")
+
 
 def fuzzy_match_zip(
     zip_code: str | None,
@@ -20,36 +25,104 @@ def fuzzy_match_zip(
     return None
 
 
+@st.cache_data(show_spinner=False)
 def resolve_zip_codes(
     listings: pd.DataFrame,
     demographics: pd.DataFrame
 ) -> pd.DataFrame:
     """Resolve missing or mismatched ZIP codes using fuzzy matching."""
-    cleaned = listings.copy()
+    zips = listings["zip_code"]
     choices = demographics["zip_code"].dropna().unique().tolist()
-    missing_mask = cleaned["zip_code"].isna() | ~cleaned["zip_code"].isin(choices)
-    cleaned.loc[missing_mask, "zip_code"] = cleaned.loc[missing_mask, "zip_code"].map(
-        lambda value: fuzzy_match_zip(value, choices)
+    choice_set = set(choices)
+    missing_mask = zips.isna() | ~zips.isin(choice_set)
+    # Exact hash-set hits never reach fuzzy matching; only rows with enough
+    # signal (non-null, >= 3 chars) are worth a fuzzy repair attempt
+    fuzzy_mask = missing_mask & zips.notna() & (zips.str.len() >= 3)
+    resolved = zips.where(~missing_mask)
+    # Duplicate listings share ZIPs, so fuzzy-match each distinct residual
+    # value once and broadcast the mapping back
+    residual = zips[fuzzy_mask].unique().tolist()
+    if residual:
+        # One SIMD-accelerated similarity matrix instead of an
+        # extractOne scan per row
+        scores = process.cdist(residual, choices, scorer=fuzz.ratio, workers=-1)
+        best = scores.argmax(axis=1)
+        hits = scores.max(axis=1) >= 90
+        mapping = {
+            query: choices[index] if hit else None
+            for query, index, hit in zip(residual, best, hits)
+        }
+        resolved[fuzzy_mask] = zips[fuzzy_mask].map(mapping)
+    return listings.assign(zip_code=resolved)
+
+
+def zip_to_lat_lon_arrays(zip_codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Generate deterministic latitude/longitude arrays from ZIP codes.
+
+    Derives coordinates from an integer hash of each ZIP with plain numpy
+    arithmetic, so the whole column is computed in one vectorized pass
+    instead of seeding a RandomState per row.
+    """
+    seeds = np.array(
+        [int(z) if str(z).isdigit() else 0 for z in zip_codes], dtype=np.int64
     )
-    return cleaned
+    lat = 25.0 + (seeds * 2654435761 % 10_000_000) / 10_000_000 * 24.0
+    lon = -124.0 + ((seeds ^ 0x9E3779B9) * 2246822519 % 10_000_000) / 10_000_000 * 58.0
+    return lat, lon
 
 
 def zip_to_lat_lon(zip_code: str) -> tuple[float, float]:
     """Generate deterministic latitude/longitude coordinates from ZIP code."""
-    seed = int(zip_code) if zip_code.isdigit() else 0
-    rng = np.random.RandomState(seed)
-    lat = rng.uniform(25.0, 49.0)
-    lon = rng.uniform(-124.0, -66.0)
-    return float(lat), float(lon)
+    lat, lon = zip_to_lat_lon_arrays(np.array([zip_code]))
+    return float(lat[0]), float(lon[0])
+
+
+def load_geo_table(zip_codes: Iterable[str]) -> pd.DataFrame:
+    """Return the persistent ZIP -> (lat, lon) lookup table.
+
+    Coordinates are a pure function of the ZIP, so the parquet table never
+    goes stale; it is loaded from disk when present and only extended (and
+    rewritten) for ZIPs it has not seen before.
+    """
+    try:
+        table = pd.read_parquet(GEO_CACHE_PATH)
+    except (OSError, ValueError):
+        table = pd.DataFrame(
+            columns=["lat", "lon"], index=pd.Index([], name="zip_code")
+        )
+    missing = [z for z in zip_codes if z not in table.index]
+    if missing:
+        lat, lon = zip_to_lat_lon_arrays(np.asarray(missing, dtype=object))
+        new_rows = pd.DataFrame(
+            {"lat": lat, "lon": lon}, index=pd.Index(missing, name="zip_code")
+        )
+        table = pd.concat([table, new_rows])
+        try:
+            GEO_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            table.to_parquet(GEO_CACHE_PATH)
+        except OSError:
+            pass  # read-only filesystem: fall back to in-memory only
+    return table
 
 
 def add_geo_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Add latitude and longitude columns based on ZIP codes."""
-    with_geo = df.copy()
-    lat_lon = with_geo["zip_code"].dropna().map(zip_to_lat_lon)
-    with_geo.loc[lat_lon.index, "lat"] = [pair[0] for pair in lat_lon]
-    with_geo.loc[lat_lon.index, "lon"] = [pair[1] for pair in lat_lon]
-    return with_geo
+    # Coordinates are a pure function of the ZIP, so compute them once per
+    # unique ZIP and broadcast back instead of once per row
+    zips = df["zip_code"]
+    if not isinstance(zips.dtype, pd.CategoricalDtype):
+        zips = zips.astype("category")
+    geo = load_geo_table(zips.cat.categories)
+    # Gather both coordinates through the integer category codes in one
+    # numpy pass; code -1 marks missing ZIPs and stays NaN
+    coords = geo.reindex(zips.cat.categories).to_numpy(dtype="float64")
+    codes = zips.cat.codes.to_numpy()
+    valid = codes >= 0
+    lat = np.full(len(df), np.nan)
+    lon = np.full(len(df), np.nan)
+    lat[valid] = coords[codes[valid], 0]
+    lon[valid] = coords[codes[valid], 1]
+    return df.assign(lat=lat, lon=lon)
 
 
 def merge_data(
@@ -58,4 +131,7 @@ def merge_data(
 ) -> pd.DataFrame:
     """Merge listings with demographics data on ZIP code."""
     merged = listings.merge(demographics, on="zip_code", how="left", validate="m:1")
+    # Categorize after the merge so both sides keep a common string key
+    # dtype; downstream isin/groupby then run on integer category codes
+    merged["zip_code"] = merged["zip_code"].astype("category")
     return merged
@@ -1,14 +1,52 @@
 """Chart builders."""
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
+import streamlit as st
 
+# Maximum number of points handed to the browser-side renderers
+VIZ_SAMPLE_SIZE = 5000
 
-def price_vs_school_chart(data: pd.DataFrame):
-    """Create scatter plot: price vs school rating."""
+
+def hash_dataframe(df: pd.DataFrame) -> tuple:
+    """Cheap DataFrame fingerprint for Streamlit cache keys."""
+    return (len(df), int(pd.util.hash_pandas_object(df, index=False).sum()))
+
+
+# Cache settings shared by the figure builders: identical filter results
+# produce identical figures, so rebuilding on every rerun is pure waste
+FIGURE_CACHE = dict(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: hash_dataframe},
+)
+
+
+def sample_for_viz(data: pd.DataFrame, n: int = VIZ_SAMPLE_SIZE) -> pd.DataFrame:
+    """Cap the row count sent to a chart, stratified by crime_index.
+
+    Rendering cost and JSON payload grow linearly with points, so large
+    filter results are downsampled proportionally per crime level; small
+    frames pass through untouched.
+    """
+    if len(data) <= n:
+        return data
+    if "crime_index" not in data.columns:
+        return data.sample(n, random_state=0)
+    return data.groupby("crime_index", observed=True, group_keys=False).sample(
+        frac=n / len(data), random_state=0
+    )
+
+
+@st.cache_data(**FIGURE_CACHE)
+def price_vs_school_chart(data: pd.DataFrame, fingerprint: tuple | None = None):
+    """Create scatter plot: price vs school rating.
+
+    ``fingerprint`` is a cheap stand-in for the active filters; it only
+    participates in the cache key.
+    """
     if data.empty:
         return None
 
+    data = sample_for_viz(data)
     fig = px.scatter(
         data,
         x="school_rating",
@@ -21,37 +59,24 @@ def price_vs_school_chart(data: pd.DataFrame):
             "school_rating": "School Rating",
             "crime_index": "Crime Level",
         },
+        render_mode="webgl",
     )
-    # Add glow effect by layering a larger, translucent trace underneath
-    glow_traces = []
-    for trace in fig.data:
-        glow_traces.append(
-            go.Scatter(
-                x=trace.x,
-                y=trace.y,
-                mode="markers",
-                marker=dict(
-                    size=18,
-                    color=trace.marker.color,
-                    opacity=0.18,
-                ),
-                hoverinfo="skip",
-                showlegend=False,
-            )
-        )
-
+    # Glow effect via a translucent marker outline on the single trace,
+    # instead of duplicating every trace underneath at 18px
     fig.update_traces(
-        marker=dict(size=8, opacity=0.9),
-        selector=dict(mode="markers")
+        marker=dict(
+            size=8,
+            opacity=0.9,
+            line=dict(width=6, color="rgba(100,100,100,0.18)"),
+        ),
+        selector=dict(mode="markers"),
     )
-
-    for glow in glow_traces:
-        fig.add_trace(glow)
     fig.update_layout(height=500)
     return fig
 
 
-def price_distribution_chart(data: pd.DataFrame):
+@st.cache_data(**FIGURE_CACHE)
+def price_distribution_chart(data: pd.DataFrame, fingerprint: tuple | None = None):
     """Create histogram: distribution of prices."""
     if data.empty:
         return None
@@ -67,12 +92,17 @@ def price_distribution_chart(data: pd.DataFrame):
     return fig
 
 
-def price_per_sqft_by_zip(data: pd.DataFrame):
+@st.cache_data(**FIGURE_CACHE)
+def price_per_sqft_by_zip(data: pd.DataFrame, fingerprint: tuple | None = None):
     """Create bar chart: average price per sqft by ZIP."""
     if data.empty:
         return None
 
-    by_zip = data.groupby("zip_code")["price_per_sqft"].mean().sort_values(ascending=False)
+    by_zip = (
+        data.groupby("zip_code", sort=False, observed=True)["price_per_sqft"]
+        .mean()
+        .sort_values(ascending=False)
+    )
 
     fig = px.bar(
         x=by_zip.index,
@@ -1,10 +1,15 @@
 """Map builders."""
 import pandas as pd
 import pydeck as pdk
+import streamlit as st
 
+from visualizations.charts import FIGURE_CACHE, sample_for_viz
 
-def map_layers(data: pd.DataFrame):
+
+@st.cache_data(**FIGURE_CACHE)
+def map_layers(data: pd.DataFrame, fingerprint: tuple | None = None):
     """Create map layers: scatter and heatmap."""
+    data = sample_for_viz(data)
     layers = [
         pdk.Layer(
             "ScatterplotLayer",
@@ -13,12 +18,13 @@ def map_layers(data: pd.DataFrame):
             get_color=[200, 30, 0, 160],
             get_radius=150,
             pickable=True,
+            auto_highlight=False,
         ),
         pdk.Layer(
             "HeatmapLayer",
             data=data,
             get_position=["lon", "lat"],
-            radiusPixels=50,
+            radiusPixels=30,
             elevationScale=4,
             opacity=0.7,
         ),
@@ -26,7 +32,8 @@ def map_layers(data: pd.DataFrame):
     return layers
 
 
-def map_view(data: pd.DataFrame):
+@st.cache_data(**FIGURE_CACHE)
+def map_view(data: pd.DataFrame, fingerprint: tuple | None = None):
     """Create map initial view state."""
     return pdk.ViewState(
         latitude=data["lat"].mean(),